@@ -9,6 +9,29 @@ import flet as ft
 import jdatetime
 from persian_datepicker_project.persian_datepicker import PersianDatePicker
 
+# Example buttons: (label, PersianDatePicker arguments, show() arguments).
+# Every row gets its own picker (see make_show_handler), so rows never share a selection,
+# displayed month or widget tree, even when their arguments are equal
+EXAMPLES = (
+    # Example 1: Simple datepicker
+    ("Simple", {}, {}),
+    # Example 2: With custom date range
+    ("Date Range", {"first_year": 1400, "last_year": 1410}, {}),
+    # Example 3: With default date (1st Farvardin 1403)
+    ("With Default", {"default_date": jdatetime.date(1403, 1, 1)}, {}),
+    # Example 4: Dark theme
+    ("Dark Theme", {}, {"is_theme_light": False}),
+    # Example 5: Open to specific month/year (Shahrivar 1403)
+    ("Specific Month", {}, {"display_year": 1403, "display_month": 6}),
+    # Example 6: Without input mode (keyboard only)
+    ("No Input Mode", {"enable_input_mode": False}, {}),
+    # Example 7: Without keyboard support
+    ("No Keyboard", {"keyboard_support": False}, {}),
+    # Example 8: Minimal (no input mode, no keyboard)
+    ("Minimal Mode", {"enable_input_mode": False, "keyboard_support": False}, {}),
+)
+BUTTONS_PER_ROW = 3
+
 
 def main(page: ft.Page):
     page.title = "Persian DatePicker - Basic Examples"
@@ -27,56 +50,30 @@ def main(page: ft.Page):
             result_text.value = f"📅 تاریخ انتخابی: {result['formatted_persian']} ({result['day_name']})"
         else:
             result_text.value = "❌ انتخاب لغو شد"
-        page.update()
-
-    # Example 1: Simple datepicker
-    def show_simple(e):
-        picker = PersianDatePicker()
-        picker.set_result_callback(on_date_result)
-        picker.show(page)
-
-    # Example 2: With custom date range
-    def show_custom_range(e):
-        picker = PersianDatePicker(first_year=1400, last_year=1410)
-        picker.set_result_callback(on_date_result)
-        picker.show(page)
-
-    # Example 3: With default date
-    def show_with_default(e):
-        custom_date = jdatetime.date(1403, 1, 1)  # 1st Farvardin 1403
-        picker = PersianDatePicker(default_date=custom_date)
-        picker.set_result_callback(on_date_result)
-        picker.show(page)
-
-    # Example 4: Dark theme
-    def show_dark_theme(e):
-        picker = PersianDatePicker()
-        picker.set_result_callback(on_date_result)
-        picker.show(page, is_theme_light=False)
-
-    # Example 5: Open to specific month/year
-    def show_specific_month(e):
-        picker = PersianDatePicker()
-        picker.set_result_callback(on_date_result)
-        picker.show(page, display_year=1403, display_month=6)  # Shahrivar 1403
-
-    # Example 6: Without input mode (keyboard only)
-    def show_no_input(e):
-        picker = PersianDatePicker(enable_input_mode=False)
-        picker.set_result_callback(on_date_result)
-        picker.show(page)
-
-    # Example 7: Without keyboard support
-    def show_no_keyboard(e):
-        picker = PersianDatePicker(keyboard_support=False)
-        picker.set_result_callback(on_date_result)
-        picker.show(page)
-
-    # Example 8: Minimal (no input mode, no keyboard)
-    def show_minimal(e):
-        picker = PersianDatePicker(enable_input_mode=False, keyboard_support=False)
-        picker.set_result_callback(on_date_result)
-        picker.show(page)
+        result_text.update()
+
+    def make_show_handler(picker_kwargs, show_kwargs):
+        # Each button owns its picker, created on first use and re-shown afterwards,
+        # so its widget tree (built for one theme) is reused instead of rebuilt
+        picker = None
+
+        def show_picker(e):
+            nonlocal picker
+            if picker is None:
+                picker = PersianDatePicker(**picker_kwargs)
+                picker.set_result_callback(on_date_result)
+            picker.show(page, **show_kwargs)
+
+        return show_picker
+
+    # Buttons
+    button_rows = [
+        ft.Row([
+            ft.ElevatedButton(label, on_click=make_show_handler(picker_kwargs, show_kwargs), width=120)
+            for label, picker_kwargs, show_kwargs in EXAMPLES[i:i + BUTTONS_PER_ROW]
+        ], alignment=ft.MainAxisAlignment.CENTER)
+        for i in range(0, len(EXAMPLES), BUTTONS_PER_ROW)
+    ]
 
     # UI Layout
     page.add(
@@ -89,23 +86,7 @@ def main(page: ft.Page):
 
             ft.Divider(),
 
-            # Buttons
-            ft.Row([
-                ft.ElevatedButton("Simple", on_click=show_simple, width=120),
-                ft.ElevatedButton("Date Range", on_click=show_custom_range, width=120),
-                ft.ElevatedButton("With Default", on_click=show_with_default, width=120),
-            ], alignment=ft.MainAxisAlignment.CENTER),
-
-            ft.Row([
-                ft.ElevatedButton("Dark Theme", on_click=show_dark_theme, width=120),
-                ft.ElevatedButton("Specific Month", on_click=show_specific_month, width=120),
-                ft.ElevatedButton("No Input Mode", on_click=show_no_input, width=120),
-            ], alignment=ft.MainAxisAlignment.CENTER),
-
-            ft.Row([
-                ft.ElevatedButton("No Keyboard", on_click=show_no_keyboard, width=120),
-                ft.ElevatedButton("Minimal Mode", on_click=show_minimal, width=120),
-            ], alignment=ft.MainAxisAlignment.CENTER),
+            *button_rows,
 
             ft.Divider(),
 
@@ -5,9 +5,61 @@ A simple event planning app using Persian DatePicker.
 Users can add events with Persian dates and view them in a list.
 """
 
+import bisect
+import itertools
+from collections import namedtuple
 import flet as ft
 import jdatetime
-from persian_datepicker_project.persian_datepicker import PersianDatePicker
+from persian_datepicker_project.persian_datepicker import PersianDatePicker, PERSIAN_DAYS
+
+# Planner event record (lighter than a dict per event)
+Event = namedtuple('Event', 'id title date date_key formatted_date day_name')
+
+# Event card styles (shared by all cards)
+CARD_BGCOLOR = ft.Colors.with_opacity(0.05, ft.Colors.BLUE)
+CARD_BORDER = ft.border.all(1, ft.Colors.with_opacity(0.2, ft.Colors.BLUE))
+CARD_TITLE_WEIGHT = ft.FontWeight.BOLD
+CARD_ROW_ALIGNMENT = ft.CrossAxisAlignment.CENTER
+DELETE_ICON = ft.Icons.DELETE
+DELETE_ICON_COLOR = ft.Colors.RED_400
+# (color, prefix) for past, today and future events, indexed by date comparison + 1
+EVENT_STATE_STYLES = (
+    (ft.Colors.GREY_500, "⏮️ گذشته"),
+    (ft.Colors.GREEN, "🎯 امروز"),
+    (ft.Colors.BLUE, "⏭️ آینده"),
+)
+
+
+def date_key(date):
+    """Integer YYYYMMDD key for cheap date comparisons (jdatetime compares in Python)"""
+    return date.year * 10000 + date.month * 100 + date.day
+
+
+def make_event_card(title, subtitle, subtitle_color, event_id, on_delete_click):
+    """Build an event card; the delete button carries event_id in its data"""
+    return ft.Container(
+        content=ft.Row([
+            ft.Column([
+                ft.Text(title,
+                        size=16,
+                        weight=CARD_TITLE_WEIGHT),
+                ft.Text(subtitle,
+                        size=12,
+                        color=subtitle_color),
+            ], expand=True),
+            ft.IconButton(
+                icon=DELETE_ICON,
+                icon_color=DELETE_ICON_COLOR,
+                tooltip="حذف رویداد",
+                data=event_id,
+                on_click=on_delete_click
+            )
+        ], vertical_alignment=CARD_ROW_ALIGNMENT),
+        padding=15,
+        bgcolor=CARD_BGCOLOR,
+        border_radius=10,
+        border=CARD_BORDER
+    )
 
 
 def main(page: ft.Page):
@@ -17,8 +69,11 @@ def main(page: ft.Page):
     page.window.height = 600
     page.padding = 20
 
-    # Data storage
+    # Data storage (sorted by date, aligned with the event cards in events_list)
     events = []
+    event_keys = []  # Parallel list of event date keys for bisect (Python 3.7 compatible)
+    rendered_day_key = None  # date_key of the day the event cards were last classified against
+    event_ids = itertools.count()
 
     # UI Components
     event_title = ft.TextField(
@@ -29,29 +84,42 @@ def main(page: ft.Page):
 
     selected_date_text = ft.Text("تاریخی انتخاب نشده", size=14, color=ft.Colors.GREY_600)
     selected_date = None
+    selected_date_formatted = None  # Picker's 'formatted_persian' string for selected_date
 
     events_list = ft.Column([], spacing=10, scroll=ft.ScrollMode.AUTO)
+    events_placeholder = ft.Text("هنوز رویدادی اضافه نکرده‌اید",
+                                 style=ft.TextThemeStyle.BODY_MEDIUM,
+                                 italic=True,
+                                 color=ft.Colors.GREY_500)
+
+    snackbar_text = ft.Text()
+    snackbar = ft.SnackBar(snackbar_text)
 
     def on_date_selected(result):
         """Handle date selection"""
-        nonlocal selected_date
+        nonlocal selected_date, selected_date_formatted
         if result:
             selected_date = result['date']
+            selected_date_formatted = result['formatted_persian']
             selected_date_text.value = f"📅 {result['formatted_persian']} ({result['day_name']})"
         else:
             selected_date = None
+            selected_date_formatted = None
             selected_date_text.value = "تاریخی انتخاب نشده"
-        page.update()
+        selected_date_text.update()
+
+    # One picker for the page; show() reuses its widget tree on every open
+    picker = PersianDatePicker()
+    picker.set_result_callback(on_date_selected)
 
     def show_datepicker(e):
         """Show date picker"""
-        picker = PersianDatePicker()
-        picker.set_result_callback(on_date_selected)
         picker.show(page)
 
     def add_event(e):
         """Add new event"""
-        if not event_title.value.strip():
+        title = event_title.value.strip()
+        if not title:
             show_snackbar("لطفاً نام رویداد را وارد کنید")
             return
 
@@ -60,91 +128,71 @@ def main(page: ft.Page):
             return
 
         # Create event
-        event = {
-            'title': event_title.value.strip(),
-            'date': selected_date,
-            'formatted_date': f"{selected_date.year}/{selected_date.month:02d}/{selected_date.day:02d}",
-            'day_name': PersianDatePicker().persian_days[selected_date.weekday()]
-        }
-        events.append(event)
-
-        # Update UI
-        update_events_list()
+        selected_key = date_key(selected_date)
+        event = Event(next(event_ids), title, selected_date, selected_key, selected_date_formatted,
+                      PERSIAN_DAYS[selected_date.weekday()])
+
+        # Keep events sorted by date (new events go after existing ones on the same day)
+        index = bisect.bisect_right(event_keys, selected_key)
+        event_keys.insert(index, selected_key)
+        events.insert(index, event)
+
+        # Update UI - only the new card unless the list needs a full refresh,
+        # then send all changes in a single update scoped to the touched controls
+        if len(events) == 1 or rendered_day_key != date_key(jdatetime.date.today()):
+            update_events_list()
+        else:
+            events_list.controls.insert(index, build_event_card(event, rendered_day_key))
         event_title.value = ""
         selected_date_text.value = "تاریخی انتخاب نشده"
-        page.update()
+        page.update(events_list, event_title, selected_date_text)
 
         show_snackbar("رویداد اضافه شد! ✅")
 
-    def delete_event(index):
-        """Delete event"""
+    def delete_event(e):
+        """Delete the event whose id is stored on the clicked delete button"""
+        index = next((i for i, event in enumerate(events) if event.id == e.control.data), None)
+        if index is None:
+            return  # Already deleted (e.g. a double click on the delete button)
+        events.pop(index)
+        event_keys.pop(index)
 
-        def delete_handler(e):
-            events.pop(index)
+        # Remove only the deleted card unless the list needs a full refresh
+        if not events or rendered_day_key != date_key(jdatetime.date.today()):
             update_events_list()
-            show_snackbar("رویداد حذف شد")
+        else:
+            events_list.controls.pop(index)
+        events_list.update()
+        show_snackbar("رویداد حذف شد")
 
-        return delete_handler
+    def build_event_card(event, today_key):
+        """Build the display card for a single event"""
+        # Determine if event is today, past, or future
+        key = event.date_key
+        date_color, date_prefix = EVENT_STATE_STYLES[(key > today_key) - (key < today_key) + 1]
+
+        subtitle = f"{date_prefix} - {event.formatted_date} ({event.day_name})"
+        return make_event_card(event.title, subtitle, date_color, event.id, delete_event)
 
     def update_events_list():
-        """Update events display"""
-        events_list.controls.clear()
+        """Rebuild the whole events display (callers send the update)"""
+        nonlocal rendered_day_key
+        today_key = date_key(jdatetime.date.today())
+        rendered_day_key = today_key
 
         if not events:
-            events_list.controls.append(
-                ft.Text("هنوز رویدادی اضافه نکرده‌اید",
-                        style=ft.TextThemeStyle.BODY_MEDIUM,
-                        italic=True,
-                        color=ft.Colors.GREY_500)
-            )
+            # Nothing to do if the placeholder is already the only control shown
+            if len(events_list.controls) == 1 and events_list.controls[0] is events_placeholder:
+                return
+            events_list.controls[:] = [events_placeholder]
         else:
-            # Sort events by date
-            sorted_events = sorted(events, key=lambda x: x['date'])
-
-            for i, event in enumerate(sorted_events):
-                # Determine if event is today, past, or future
-                today = jdatetime.date.today()
-                if event['date'] == today:
-                    date_color = ft.Colors.GREEN
-                    date_prefix = "🎯 امروز"
-                elif event['date'] < today:
-                    date_color = ft.Colors.GREY_500
-                    date_prefix = "⏮️ گذشته"
-                else:
-                    date_color = ft.Colors.BLUE
-                    date_prefix = "⏭️ آینده"
-
-                event_card = ft.Container(
-                    content=ft.Row([
-                        ft.Column([
-                            ft.Text(event['title'],
-                                    size=16,
-                                    weight=ft.FontWeight.BOLD),
-                            ft.Text(f"{date_prefix} - {event['formatted_date']} ({event['day_name']})",
-                                    size=12,
-                                    color=date_color),
-                        ], expand=True),
-                        ft.IconButton(
-                            icon=ft.Icons.DELETE,
-                            icon_color=ft.Colors.RED_400,
-                            tooltip="حذف رویداد",
-                            on_click=delete_event(i)
-                        )
-                    ], vertical_alignment=ft.CrossAxisAlignment.CENTER),
-                    padding=15,
-                    bgcolor=ft.Colors.with_opacity(0.05, ft.Colors.BLUE),
-                    border_radius=10,
-                    border=ft.border.all(1, ft.Colors.with_opacity(0.2, ft.Colors.BLUE))
-                )
-                events_list.controls.append(event_card)
-
-        page.update()
+            # Events are already kept sorted by date; replace all cards in one assignment
+            events_list.controls[:] = [build_event_card(event, today_key) for event in events]
 
     def show_snackbar(message):
         """Show snackbar message"""
-        page.snack_bar = ft.SnackBar(ft.Text(message))
-        page.snack_bar.open = True
-        page.update()
+        snackbar_text.value = message
+        page.open(snackbar)  # Sends only the snackbar, not the whole page
 
     # Initial events list
     update_events_list()
@@ -1,2 +1,2 @@
 # persian_datepicker/__init__.py
-from .persian_datepicker import PersianDatePicker
+from .persian_datepicker import PersianDatePicker, ThemeColors, PERSIAN_MONTHS, PERSIAN_DAYS, PERSIAN_DAY_ABBR, PERSIAN_NUMERALS
@@ -41,13 +41,113 @@ import flet as ft
 import re
 import jdatetime
 import functools
+import itertools
+from collections.abc import Mapping
 from typing import Optional, Callable
 
 
+# Persian month names
+PERSIAN_MONTHS = (
+    "فروردین", "اردیبهشت", "خرداد", "تیر", "مرداد", "شهریور",
+    "مهر", "آبان", "آذر", "دی", "بهمن", "اسفند"
+)
+
+# Persian day names (Saturday to Friday), indexed by jdatetime weekday
+PERSIAN_DAYS = ("شنبه", "یکشنبه", "دوشنبه", "سه‌شنبه", "چهارشنبه", "پنج‌شنبه", "جمعه")
+PERSIAN_DAY_ABBR = ("ش", "ی", "د", "س", "چ", "پ", "ج")
+
+# Persian numerals
+PERSIAN_NUMERALS = "۰۱۲۳۴۵۶۷۸۹"
+
+# Days in each Persian month (Esfand is 30 days in leap years)
+_MONTH_LEN = (31,) * 6 + (30,) * 5 + (29,)
+
+
+# Positions of the leap years in the 33-year cycle (the same arithmetic rule jdatetime uses)
+_LEAP_REMAINDERS = frozenset((1, 5, 9, 13, 17, 22, 26, 30))
+
+
+def _is_jleap(year):
+    """Check whether a Persian year is a leap year"""
+    return year % 33 in _LEAP_REMAINDERS
+
+
+@functools.lru_cache(maxsize=2048)
+def _first_weekday(year, month):
+    """Get the weekday of the first day of a Persian month, 0=Saturday (cached for performance)"""
+    return jdatetime.date(year, month, 1).weekday()  # jdatetime weekday: 0=Saturday
+
+
+# Translation table from English digits to Persian numerals (used with str.translate)
+_EN2FA = str.maketrans("0123456789", PERSIAN_NUMERALS)
+
+
+@functools.lru_cache(maxsize=64)
+def _month_layout(year, month):
+    """Get (days_in_month, first_day_weekday, Persian day labels) for a Persian month (cached for performance)"""
+    days_in_month = 30 if month == 12 and _is_jleap(year) else _MONTH_LEN[month - 1]
+    day_labels = tuple(str(day).translate(_EN2FA) for day in range(1, days_in_month + 1))
+    return days_in_month, _first_weekday(year, month), day_labels
+
+# Zero-padded month and day strings for the YYYY/MM/DD result format
+_MM_PADDED = tuple(f"{month:02d}" for month in range(13))
+_DD_PADDED = tuple(f"{day:02d}" for day in range(32))
+
+
 # =============================================================================
 # CONFIGURATION SECTION - Customize all parameters here
 # =============================================================================
 
+class ThemeColors(Mapping):
+    """
+    Resolved colors of one theme, as returned by PersianDatePickerConfig.get_theme_colors.
+
+    A read-only mapping of color name to color, so code written against the former dict
+    ("key" in colors, colors["key"], .keys(), .items(), dict(colors)) keeps working, while the
+    datepicker itself reads the colors as attributes.
+    """
+    _fields = (
+        "primary_color", "secondary_color", "text_primary", "text_secondary", "text_muted",
+        "text_header", "text_day_header", "main_bgcolor", "right_panel_bgcolor", "selected_text_color",
+        "divider_color", "text_primary_bgcolor", "default_date_border_color", "default_date_bgcolor",
+        "cell_hover_color", "action_buttons_hover_color", "input_color", "input_focus_border_color",
+        "error_text_color",
+    )
+    __slots__ = _fields + ("_hash",)
+
+    def __init__(self, **colors):
+        for name in self._fields:
+            object.__setattr__(self, name, colors[name])
+        object.__setattr__(self, "_hash", hash(tuple(colors[name] for name in self._fields)))
+
+    @classmethod
+    def from_mapping(cls, colors):
+        """Return colors as ThemeColors, converting a plain mapping (e.g. from an overridden get_theme_colors)"""
+        if isinstance(colors, cls):
+            return colors
+        return cls(**{name: colors[name] for name in cls._fields})
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ThemeColors is read-only")
+
+    def __getitem__(self, key):
+        if key in self._fields:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        return f"ThemeColors({dict(self)!r})"
+
+
 class PersianDatePickerConfig:
     """Centralized configuration for Persian DatePicker customization"""
     # === DATE RANGE SETTINGS ===
@@ -257,52 +357,63 @@ class PersianDatePickerConfig:
     CALENDAR_WEEKS = 6  # Number of weeks to display
     DAYS_PER_WEEK = 7
 
+    _theme_cache = None  # {is_light_theme: colors}, filled per instance by get_theme_colors
+
     def get_theme_colors(self, is_light_theme: bool):
-        """Get color configuration based on theme"""
+        """Get color configuration based on theme (built on first request and cached)"""
+        if self._theme_cache is None:
+            self._theme_cache = {}
+        theme_colors = self._theme_cache.get(is_light_theme)
+        if theme_colors is None:
+            theme_colors = self._theme_cache[is_light_theme] = self.build_theme_colors(is_light_theme)
+        return theme_colors
+
+    def build_theme_colors(self, is_light_theme: bool):
+        """Build the color configuration for a theme"""
         if is_light_theme:
-            return {
-                'primary_color': self.LIGHT_PRIMARY_COLOR,
-                'secondary_color': self.LIGHT_SECONDARY_COLOR,
-                'text_primary': self.LIGHT_TEXT_PRIMARY,
-                'text_secondary': self.LIGHT_TEXT_SECONDARY,
-                'text_muted': self.LIGHT_TEXT_MUTED,
-                'text_header': self.LIGHT_TEXT_HEADER,
-                'text_day_header': self.LIGHT_TEXT_DAY_HEADER,
-                'main_bgcolor': self.LIGHT_MAIN_BGCOLOR,
-                'right_panel_bgcolor': self.LIGHT_RIGHT_PANEL_BGCOLOR,
-                'selected_text_color': self.LIGHT_SELECTED_TEXT_COLOR,
-                'divider_color': self.LIGHT_DIVIDER_COLOR,
-                'text_primary_bgcolor': self.LIGHT_TEXT_PRIMARY_BGCOLOR,
-                'default_date_border_color': self.LIGHT_DEFAULT_DATE_BORDER_COLOR,
-                'default_date_bgcolor': self.LIGHT_DEFAULT_DATE_BGCOLOR,
-                'cell_hover_color': self.LIGHT_CELL_HOVER_COLOR,
-                'action_buttons_hover_color': self.LIGHT_ACTION_BUTTONS_HOVER_COLOR,
-                'input_color': self.LIGHT_INPUT_COLOR,
-                'input_focus_border_color': self.LIGHT_INPUT_FOCUS_BORDER_COLOR,
-                'error_text_color': self.LIGHT_ERROR_TEXT_COLOR,
-            }
+            return ThemeColors(
+                primary_color=self.LIGHT_PRIMARY_COLOR,
+                secondary_color=self.LIGHT_SECONDARY_COLOR,
+                text_primary=self.LIGHT_TEXT_PRIMARY,
+                text_secondary=self.LIGHT_TEXT_SECONDARY,
+                text_muted=self.LIGHT_TEXT_MUTED,
+                text_header=self.LIGHT_TEXT_HEADER,
+                text_day_header=self.LIGHT_TEXT_DAY_HEADER,
+                main_bgcolor=self.LIGHT_MAIN_BGCOLOR,
+                right_panel_bgcolor=self.LIGHT_RIGHT_PANEL_BGCOLOR,
+                selected_text_color=self.LIGHT_SELECTED_TEXT_COLOR,
+                divider_color=self.LIGHT_DIVIDER_COLOR,
+                text_primary_bgcolor=self.LIGHT_TEXT_PRIMARY_BGCOLOR,
+                default_date_border_color=self.LIGHT_DEFAULT_DATE_BORDER_COLOR,
+                default_date_bgcolor=self.LIGHT_DEFAULT_DATE_BGCOLOR,
+                cell_hover_color=self.LIGHT_CELL_HOVER_COLOR,
+                action_buttons_hover_color=self.LIGHT_ACTION_BUTTONS_HOVER_COLOR,
+                input_color=self.LIGHT_INPUT_COLOR,
+                input_focus_border_color=self.LIGHT_INPUT_FOCUS_BORDER_COLOR,
+                error_text_color=self.LIGHT_ERROR_TEXT_COLOR,
+            )
         else:
-            return {
-                'primary_color': self.DARK_PRIMARY_COLOR,
-                'secondary_color': self.DARK_SECONDARY_COLOR,
-                'text_primary': self.DARK_TEXT_PRIMARY,
-                'text_secondary': self.DARK_TEXT_SECONDARY,
-                'text_muted': self.DARK_TEXT_MUTED,
-                'text_header': self.DARK_TEXT_HEADER,
-                'text_day_header': self.DARK_TEXT_DAY_HEADER,
-                'main_bgcolor': self.DARK_MAIN_BGCOLOR,
-                'right_panel_bgcolor': self.DARK_RIGHT_PANEL_BGCOLOR,
-                'selected_text_color': self.DARK_SELECTED_TEXT_COLOR,
-                'divider_color': self.DARK_DIVIDER_COLOR,
-                'text_primary_bgcolor': self.DARK_TEXT_PRIMARY_BGCOLOR,
-                'default_date_border_color': self.DARK_DEFAULT_DATE_BORDER_COLOR,
-                'default_date_bgcolor': self.DARK_DEFAULT_DATE_BGCOLOR,
-                'cell_hover_color': self.DARK_CELL_HOVER_COLOR,
-                'action_buttons_hover_color': self.DARK_ACTION_BUTTONS_HOVER_COLOR,
-                'input_color': self.DARK_INPUT_COLOR,
-                'input_focus_border_color': self.DARK_INPUT_FOCUS_BORDER_COLOR,
-                'error_text_color': self.DARK_ERROR_TEXT_COLOR,
-            }
+            return ThemeColors(
+                primary_color=self.DARK_PRIMARY_COLOR,
+                secondary_color=self.DARK_SECONDARY_COLOR,
+                text_primary=self.DARK_TEXT_PRIMARY,
+                text_secondary=self.DARK_TEXT_SECONDARY,
+                text_muted=self.DARK_TEXT_MUTED,
+                text_header=self.DARK_TEXT_HEADER,
+                text_day_header=self.DARK_TEXT_DAY_HEADER,
+                main_bgcolor=self.DARK_MAIN_BGCOLOR,
+                right_panel_bgcolor=self.DARK_RIGHT_PANEL_BGCOLOR,
+                selected_text_color=self.DARK_SELECTED_TEXT_COLOR,
+                divider_color=self.DARK_DIVIDER_COLOR,
+                text_primary_bgcolor=self.DARK_TEXT_PRIMARY_BGCOLOR,
+                default_date_border_color=self.DARK_DEFAULT_DATE_BORDER_COLOR,
+                default_date_bgcolor=self.DARK_DEFAULT_DATE_BGCOLOR,
+                cell_hover_color=self.DARK_CELL_HOVER_COLOR,
+                action_buttons_hover_color=self.DARK_ACTION_BUTTONS_HOVER_COLOR,
+                input_color=self.DARK_INPUT_COLOR,
+                input_focus_border_color=self.DARK_INPUT_FOCUS_BORDER_COLOR,
+                error_text_color=self.DARK_ERROR_TEXT_COLOR,
+            )
 
 
 class PersianDatePicker:
@@ -322,6 +433,26 @@ class PersianDatePicker:
     - Professional error handling with Persian error messages
     """
 
+    __slots__ = (
+        # Configuration and date range
+        "config", "first_year", "last_year", "current_date", "enable_input_mode", "keyboard_support",
+        # Selection and display state
+        "_selected_date", "_formatted_selected_date", "display_month", "display_year",
+        "default_date", "original_selected_date",
+        "result", "is_year_mode", "is_input_mode", "input_error", "temp_input_value",
+        "is_datepicker_open", "on_result_callback", "_original_keyboard_handler",
+        # Persian names and numeral labels
+        "_persian_months", "_month_year_labels", "persian_days", "persian_day_abbr", "persian_numerals", "_day_fa", "_year_fa",
+        # Widget tree built by _build_ui
+        "overlay_container", "month_year_text", "_ui_page", "_ui_is_theme_light", "_refresh_ui",
+        "_on_page_keyboard", "_month_year_shown", "_attached", "_day_headers_cache", "_button_styles_cache",
+        "_input_field", "_error_text", "_last_render_state",
+        # Calendar and year grid cells
+        "_day_cells", "_day_bgcolors", "_day_cell_handlers", "_day_cell_styles", "_calendar_rows", "_grid_month",
+        "_year_cells", "_year_cell_bgcolors", "_year_rows", "_selected_year",
+        "__weakref__",
+    )
+
     def __init__(self, first_year=PersianDatePickerConfig.DEFAULT_FIRST_YEAR,
                  last_year=PersianDatePickerConfig.DEFAULT_LAST_YEAR,
                  default_date: Optional[jdatetime.date] = None,
@@ -374,18 +505,47 @@ class PersianDatePicker:
         self.on_result_callback = None  # Callback for result
         self.overlay_container = None  # Store reference to overlay
 
-        # Persian month names
-        self.persian_months = [
-            "فروردین", "اردیبهشت", "خرداد", "تیر", "مرداد", "شهریور",
-            "مهر", "آبان", "آذر", "دی", "بهمن", "اسفند"
-        ]
-
-        # Persian day names (Saturday to Friday)
-        self.persian_days = ["شنبه", "یکشنبه", "دوشنبه", "سه‌شنبه", "چهارشنبه", "پنج‌شنبه", "جمعه"]
-        self.persian_day_abbr = ["ش", "ی", "د", "س", "چ", "پ", "ج"]
-
-        # Persian numerals
-        self.persian_numerals = "۰۱۲۳۴۵۶۷۸۹"
+        # Widget tree built by _build_ui, reused across show() calls on the same page and theme
+        self._ui_page = None
+        self._ui_is_theme_light = None
+        self._refresh_ui = None
+        self._on_page_keyboard = None
+        self._attached = False  # Whether overlay_container is currently in page.overlay
+        self._day_headers_cache = {}  # {is_theme_light: day headers row}
+        self._button_styles_cache = {}  # {theme_colors: (today, OK, cancel) button styles}
+        self._last_render_state = None  # State the widget tree last showed, see update_calendar_view
+
+        # Persian month and day names and numerals (shared module tuples, may be replaced per instance)
+        self.persian_months = PERSIAN_MONTHS
+        self.persian_days = PERSIAN_DAYS
+        self.persian_day_abbr = PERSIAN_DAY_ABBR
+        self.persian_numerals = PERSIAN_NUMERALS
+
+        # Precomputed Persian numeral labels for day cells (indexed by day) and the year range
+        self._day_fa = [None] + [str(day).translate(_EN2FA) for day in range(1, 32)]
+        self._year_fa = {}
+        if first_year and last_year:
+            self._year_fa = {year: str(year).translate(_EN2FA) for year in range(first_year, last_year + 1)}
+
+    @property
+    def selected_date(self) -> jdatetime.date:
+        """The currently selected date"""
+        return self._selected_date
+
+    @selected_date.setter
+    def selected_date(self, value: jdatetime.date):
+        self._selected_date = value
+        self._formatted_selected_date = None  # Recomputed by format_selected_date on next use
+
+    @property
+    def persian_months(self):
+        """The Persian month names, indexed from 0 (Farvardin)"""
+        return self._persian_months
+
+    @persian_months.setter
+    def persian_months(self, value):
+        self._persian_months = value
+        self._month_year_labels = {}  # Labels built from the previous names are stale
 
     def set_result_callback(self, callback: Callable):
         """Set callback function to handle the result"""
@@ -401,10 +561,7 @@ class PersianDatePicker:
 
     def to_persian_num(self, num):
         """Convert English numbers to Persian numerals"""
-        result = ""
-        for digit in str(num):
-            result += self.persian_numerals[int(digit)]
-        return result
+        return str(num).translate(_EN2FA)
 
     def move_to_previous_day(self):
         """Move to previous day, crossing month boundaries if needed"""
@@ -501,41 +658,38 @@ class PersianDatePicker:
         """Format date for input field"""
         return f"{date_obj.year}/{date_obj.month:02d}/{date_obj.day:02d}"
 
-    @functools.lru_cache(maxsize=128)
     def get_month_days(self, year, month):
-        """Get number of days in a Persian month (cached for performance)"""
-        if month <= 6:
-            return 31
-        elif month <= 11:
-            return 30
-        else:  # month 12 (Esfand)
-            return 30 if jdatetime.date(year, 1, 1).isleap() else 29
+        """Get number of days in a Persian month (Esfand has 30 days in leap years)"""
+        return 30 if month == 12 and _is_jleap(year) else _MONTH_LEN[month - 1]
 
     def get_first_day_of_month(self, year, month):
         """Get the weekday of the first day of the month (0=Saturday)"""
-        first_day = jdatetime.date(year, month, 1)
-        return first_day.weekday()  # jdatetime weekday: 0=Saturday
+        return _first_weekday(year, month)
 
     def format_selected_date(self):
-        """Format selected date for display"""
-        day_name = self.persian_days[self.selected_date.weekday()]
-        month_name = self.persian_months[self.selected_date.month - 1]
-        day_num = self.to_persian_num(self.selected_date.day)
-        return f"{day_name}، {month_name}\n{day_num}"
+        """Format selected date for display (cached until the selection changes)"""
+        if self._formatted_selected_date is None:
+            selected_date = self._selected_date
+            day_name = self.persian_days[selected_date.weekday()]
+            month_name = self.persian_months[selected_date.month - 1]
+            self._formatted_selected_date = f"{day_name}، {month_name}\n{self._day_fa[selected_date.day]}"
+        return self._formatted_selected_date
 
     def get_selected_date_info(self):
         """Get complete selected date information"""
+        selected_date = self.selected_date
+        year, month, day = selected_date.year, selected_date.month, selected_date.day
         return {
-            'date': self.selected_date,
-            'formatted_persian': f"{self.selected_date.year}/{self.selected_date.month:02d}/{self.selected_date.day:02d}",
+            'date': selected_date,
+            'formatted_persian': f"{year}/{_MM_PADDED[month]}/{_DD_PADDED[day]}",
             'formatted_display': self.format_selected_date(),
-            'day_name': self.persian_days[self.selected_date.weekday()],
-            'month_name': self.persian_months[self.selected_date.month - 1],
-            'year': self.selected_date.year,
-            'month': self.selected_date.month,
-            'day': self.selected_date.day,
-            'is_default': self.selected_date == self.default_date,
-            'was_originally_selected': self.selected_date == self.original_selected_date
+            'day_name': self.persian_days[selected_date.weekday()],
+            'month_name': self.persian_months[month - 1],
+            'year': year,
+            'month': month,
+            'day': day,
+            'is_default': selected_date == self.default_date,
+            'was_originally_selected': selected_date == self.original_selected_date
         }
 
     def is_date_equal(self, date1: jdatetime.date, date2: jdatetime.date) -> bool:
@@ -551,164 +705,296 @@ class PersianDatePicker:
                 e.control.bgcolor = hover_color
         else:  # Mouse leave
             e.control.bgcolor = original_bg
-        page.update()
+        page.update(e.control)
+
+    def get_month_layout(self, year, month):
+        """Get (days_in_month, first_day_weekday, Persian day labels) for a month (cached for performance)"""
+        return _month_layout(year, month)
+
+    def get_month_year_label(self, year, month):
+        """Get the "month year" header label in Persian (cached until the month names change)"""
+        label = self._month_year_labels.get((year, month))
+        if label is None:
+            label = f"{self._persian_months[month - 1]} {self._year_fa.get(year) or self.to_persian_num(year)}"
+            self._month_year_labels[(year, month)] = label
+        return label
+
+    def get_button_styles(self, theme_colors):
+        """Get the (today, OK, cancel) button styles for a theme (cached for performance)"""
+        styles = self._button_styles_cache.get(theme_colors)
+        if styles is not None:
+            return styles
+
+        today_style = ft.ButtonStyle(
+            bgcolor=theme_colors.secondary_color,
+            color=theme_colors.selected_text_color,
+            padding=ft.padding.symmetric(horizontal=12, vertical=6),
+            shape=ft.RoundedRectangleBorder(radius=8)
+        )
+        ok_style = ft.ButtonStyle(
+            bgcolor=theme_colors.secondary_color,
+            color=theme_colors.selected_text_color,
+            padding=ft.padding.symmetric(
+                horizontal=self.config.OK_BUTTON_PADDING_H,
+                vertical=self.config.OK_BUTTON_PADDING_V
+            )
+        )
+        cancel_style = ft.ButtonStyle(
+            color=theme_colors.secondary_color,
+            padding=ft.padding.symmetric(
+                horizontal=self.config.CANCEL_BUTTON_PADDING_H,
+                vertical=self.config.CANCEL_BUTTON_PADDING_V
+            )
+        )
+        styles = self._button_styles_cache[theme_colors] = (today_style, ok_style, cancel_style)
+        return styles
 
-    def create_calendar_grid(self, on_date_click, theme_colors, page):
-        """Create the calendar grid for the current display month with enhanced date highlighting"""
-        days_in_month = self.get_month_days(self.display_year, self.display_month)
-        first_day_weekday = self.get_first_day_of_month(self.display_year, self.display_month)
+    def create_day_headers(self, theme_colors):
+        """Create the row of weekday abbreviations shown above the calendar grid"""
+        return ft.Row(
+            [
+                ft.Container(
+                    content=ft.Text(
+                        day,
+                        color=theme_colors.text_header,
+                        size=self.config.DAY_HEADER_FONT_SIZE,
+                        weight=self.config.DAY_HEADER_FONT_WEIGHT
+                    ),
+                    width=self.config.DAY_CELL_WIDTH,
+                    height=self.config.DAY_CELL_HEIGHT,
+                    alignment=ft.alignment.center
+                )
+                for day in self.persian_day_abbr
+            ],
+            spacing=self.config.CALENDAR_ROW_SPACING
+        )
 
-        calendar_rows = []
-        current_row = []
-        day_counter = 1
+    def create_calendar_grid(self, on_date_click, theme_colors, page):
+        """Create the calendar grid cells once; update_calendar_grid fills them for the display month"""
+        cfg = self.config
+        self._day_cells = []
+        self._grid_month = None  # (year, month, first weekday) currently shown by the cells
+        self._day_bgcolors = [None] * 32  # Resting background of each day's cell, restored after hover
+        self._calendar_rows = []
+        hover_color = theme_colors.cell_hover_color
+
+        # Shared handlers; each cell's data holds the day it currently shows
+        def on_cell_click(e):
+            on_date_click(e.control.data)
+
+        def on_cell_hover(e):
+            self.handle_cell_hover(e, self._day_bgcolors[e.control.data], hover_color, page)
+
+        # Attached by update_calendar_grid only while a cell shows a day
+        self._day_cell_handlers = (on_cell_click, on_cell_hover)
+
+        # (text color, background, border) for each highlight state, shared by every cell
+        text_primary = theme_colors.text_primary
+        self._day_cell_styles = {
+            "plain": (text_primary, None, None),
+            "selected": (theme_colors.selected_text_color, theme_colors.text_primary_bgcolor, None),
+            "default": (
+                text_primary,
+                theme_colors.default_date_bgcolor,
+                ft.border.all(width=cfg.DEFAULT_DATE_BORDER_WIDTH,
+                              color=theme_colors.default_date_border_color)
+            ),
+            "original": (text_primary, ft.Colors.with_opacity(0.1, theme_colors.text_primary_bgcolor), None),
+        }
 
-        # Create rows of days
-        for week in range(self.config.CALENDAR_WEEKS):
+        # Create rows of cells; their content is assigned by update_calendar_grid
+        font_weight = cfg.DAY_CELL_FONT_WEIGHT
+        font_size = cfg.DAY_CELL_FONT_SIZE
+        width = cfg.DAY_CELL_WIDTH
+        height = cfg.DAY_CELL_HEIGHT
+        border_radius = cfg.DAY_CELL_BORDER_RADIUS
+        for week in range(cfg.CALENDAR_WEEKS):
             current_row = []
-            for day_of_week in range(self.config.DAYS_PER_WEEK):
-                if week == 0 and day_of_week < first_day_weekday:
-                    # Empty cell before month starts
-                    current_row.append(ft.Container(
-                        width=self.config.DAY_CELL_WIDTH,
-                        height=self.config.DAY_CELL_HEIGHT
-                    ))
-                elif day_counter <= days_in_month:
-                    # Create day cell with enhanced highlighting
-                    current_date = jdatetime.date(self.display_year, self.display_month, day_counter)
-
-                    # Determine the state of this date
-                    is_selected = self.is_date_equal(current_date, self.selected_date)
-                    is_default = self.is_date_equal(current_date, self.default_date)
-                    is_original = self.is_date_equal(current_date, self.original_selected_date)
-
-                    # Determine colors and styling based on date state
-                    text_color = theme_colors["text_primary"]
-                    bg_color = None
-                    border = None
-
-                    if is_selected:
-                        # Currently selected date - highest priority
-                        text_color = theme_colors["selected_text_color"]
-                        bg_color = theme_colors["text_primary_bgcolor"]
-                    elif is_default:
-                        # Default date - yellow border and light background
-                        text_color = theme_colors["text_primary"]
-                        bg_color = theme_colors["default_date_bgcolor"]
-                        border = ft.border.all(
-                            width=self.config.DEFAULT_DATE_BORDER_WIDTH,
-                            color=theme_colors["default_date_border_color"]
-                        )
-                    elif is_original and not is_selected:
-                        # Originally selected date but not currently selected - subtle highlighting
-                        text_color = theme_colors["text_primary"]
-                        bg_color = ft.Colors.with_opacity(0.1, theme_colors["text_primary_bgcolor"])
+            for day_of_week in range(cfg.DAYS_PER_WEEK):
+                day_cell = ft.Container(
+                    content=ft.Text("", weight=font_weight, size=font_size),
+                    width=width,
+                    height=height,
+                    border_radius=border_radius,
+                    alignment=ft.alignment.center
+                )
+                self._day_cells.append(day_cell)
+                current_row.append(day_cell)
 
-                    day_cell = ft.Container(
-                        content=ft.Text(
-                            self.to_persian_num(day_counter),
-                            color=text_color,
-                            weight=self.config.DAY_CELL_FONT_WEIGHT,
-                            size=self.config.DAY_CELL_FONT_SIZE
-                        ),
-                        width=self.config.DAY_CELL_WIDTH,
-                        height=self.config.DAY_CELL_HEIGHT,
-                        bgcolor=bg_color,
-                        border=border,
-                        border_radius=self.config.DAY_CELL_BORDER_RADIUS,
-                        alignment=ft.alignment.center,
-                        on_click=lambda e, day=day_counter: on_date_click(day),
-                        on_hover=lambda e, original_bg=bg_color: self.handle_cell_hover(e, original_bg, theme_colors[
-                            'cell_hover_color'], page)
-                    )
-                    current_row.append(day_cell)
-                    day_counter += 1
-                else:
-                    # Empty cell after month ends
-                    current_row.append(ft.Container(
-                        width=self.config.DAY_CELL_WIDTH,
-                        height=self.config.DAY_CELL_HEIGHT
-                    ))
+            self._calendar_rows.append(ft.Row(current_row, spacing=cfg.CALENDAR_ROW_SPACING))
 
-            calendar_rows.append(ft.Row(current_row, spacing=self.config.CALENDAR_ROW_SPACING))
+        return self._calendar_rows
 
-            # Stop if we've added all days
-            if day_counter > days_in_month:
-                break
+    def get_highlight_days(self):
+        """Get the day numbers of the selected, default and original dates within the display month (None if outside)"""
+        display_month = (self.display_year, self.display_month)
+        return tuple(
+            date.day if (date.year, date.month) == display_month else None
+            for date in (self.selected_date, self.default_date, self.original_selected_date)
+        )
 
-        return calendar_rows
+    def style_day_cell(self, day_cell, day, highlight_days):
+        """Apply selected/default/original highlighting to the cell showing day of the display month"""
+        selected_day, default_day, original_day = highlight_days
+
+        # Determine the state of this date, in priority order
+        if day == selected_day:
+            # Currently selected date - highest priority
+            style = self._day_cell_styles["selected"]
+        elif day == default_day:
+            # Default date - yellow border and light background
+            style = self._day_cell_styles["default"]
+        elif day == original_day:
+            # Originally selected date but not currently selected - subtle highlighting
+            style = self._day_cell_styles["original"]
+        else:
+            style = self._day_cell_styles["plain"]
+
+        day_cell.content.color, day_cell.bgcolor, day_cell.border = style
+        self._day_bgcolors[day] = style[1]
+
+    def update_calendar_grid(self):
+        """Fill the calendar grid cells for the current display month with enhanced date highlighting"""
+        days_in_month, first_day_weekday, day_labels = self.get_month_layout(self.display_year, self.display_month)
+        self._grid_month = (self.display_year, self.display_month, first_day_weekday)
+        style_day_cell = self.style_day_cell
+        highlight_days = self.get_highlight_days()
+        on_click, on_hover = self._day_cell_handlers
+
+        for slot, day_cell in enumerate(self._day_cells):
+            day = slot - first_day_weekday + 1
+            if 1 <= day <= days_in_month:
+                # Day cell with enhanced highlighting
+                style_day_cell(day_cell, day, highlight_days)
+                day_cell.content.value = day_labels[day - 1]
+                day_cell.on_click = on_click
+                day_cell.on_hover = on_hover
+                day_cell.data = day
+            else:
+                # Empty cell before month starts or after month ends
+                day_cell.content.value = ""
+                day_cell.on_click = None
+                day_cell.on_hover = None
+                day_cell.data = None
+                day_cell.bgcolor = None
+                day_cell.border = None
+
+        # Show only the weeks that contain days of this month
+        days_per_week = self.config.DAYS_PER_WEEK
+        for week, row in enumerate(self._calendar_rows):
+            row.visible = week * days_per_week < first_day_weekday + days_in_month
+
+    def restyle_selected_day(self, previous_date):
+        """Move the selection highlight from previous_date to selected_date within the displayed grid.
+
+        Returns the restyled cells, or None if the grid is not showing the selected date's month,
+        in which case a full update_calendar_grid is needed.
+        """
+        display_year, display_month, first_day_weekday = self._grid_month
+        if (self.selected_date.year, self.selected_date.month) != (display_year, display_month):
+            return None
+
+        highlight_days = self.get_highlight_days()
+        restyled_cells = []
+        for date in (previous_date, self.selected_date):
+            if date.year == display_year and date.month == display_month:
+                day_cell = self._day_cells[first_day_weekday + date.day - 1]
+                self.style_day_cell(day_cell, date.day, highlight_days)
+                restyled_cells.append(day_cell)
+        return restyled_cells
 
     def create_year_grid(self, on_year_click, theme_colors, page):
-        """Create the year grid for year selection"""
-        current_year = self.display_year
-        start_year = self.first_year
-        end_year = self.last_year
-
-        year_rows = []
-        years = list(range(start_year, end_year + 1))
-
-        # Create rows with specified years per row
-        for i in range(0, len(years), self.config.YEARS_PER_ROW):
-            row_years = years[i:i + self.config.YEARS_PER_ROW]
-            year_cells = []
-
-            for year in row_years:
-                is_selected = (year == self.display_year)
-
-                bg_color = theme_colors["text_primary_bgcolor"] if is_selected else None
-
-                year_cell = ft.Container(
-                    content=ft.Text(
-                        self.to_persian_num(year),
-                        color=theme_colors["selected_text_color"] if is_selected else theme_colors["text_primary"],
-                        weight=self.config.YEAR_CELL_FONT_WEIGHT,
-                        size=self.config.YEAR_CELL_FONT_SIZE
-                    ),
-                    width=self.config.YEAR_CELL_WIDTH,
-                    height=self.config.YEAR_CELL_HEIGHT,
-                    bgcolor=bg_color,
-                    border_radius=self.config.YEAR_CELL_BORDER_RADIUS,
-                    alignment=ft.alignment.center,
-                    on_click=lambda e, y=year: on_year_click(y),
-                    on_hover=lambda e, original_bg=bg_color: self.handle_cell_hover(e, original_bg,
-                                                                                    theme_colors['cell_hover_color'],
-                                                                                    page)
-                )
-                year_cells.append(year_cell)
-
-            # Fill remaining cells if needed
-            while len(year_cells) < self.config.YEARS_PER_ROW:
-                year_cells.append(ft.Container(
-                    width=self.config.YEAR_CELL_WIDTH,
-                    height=self.config.YEAR_CELL_HEIGHT
-                ))
-
-            year_rows.append(
-                ft.Row(
-                    year_cells,
-                    spacing=self.config.YEAR_ROW_SPACING,
-                    alignment=ft.MainAxisAlignment.CENTER
+        """Create the year grid once per datepicker build; later calls only move the selection"""
+        if self._year_rows is None:
+            cfg = self.config
+            self._year_cells = {}
+            self._year_cell_bgcolors = {}  # Resting background of each year cell, restored after hover
+            self._year_rows = []
+            self._selected_year = None
+            hover_color = theme_colors.cell_hover_color
+            text_primary = theme_colors.text_primary
+            years = iter(range(self.first_year, self.last_year + 1))
+
+            # Shared handlers; each cell's data holds its year
+            def on_cell_click(e):
+                on_year_click(e.control.data)
+
+            def on_cell_hover(e):
+                self.handle_cell_hover(e, self._year_cell_bgcolors[e.control.data], hover_color, page)
+
+            # Create rows with specified years per row; the last row is padded with None
+            for row_years in itertools.zip_longest(*[years] * cfg.YEARS_PER_ROW):
+                year_cells = []
+
+                for year in row_years:
+                    if year is None:
+                        # Empty cell filling the last row
+                        year_cells.append(ft.Container(
+                            width=cfg.YEAR_CELL_WIDTH,
+                            height=cfg.YEAR_CELL_HEIGHT
+                        ))
+                        continue
+
+                    year_cell = ft.Container(
+                        content=ft.Text(
+                            self._year_fa.get(year) or self.to_persian_num(year),
+                            color=text_primary,
+                            weight=cfg.YEAR_CELL_FONT_WEIGHT,
+                            size=cfg.YEAR_CELL_FONT_SIZE
+                        ),
+                        width=cfg.YEAR_CELL_WIDTH,
+                        height=cfg.YEAR_CELL_HEIGHT,
+                        border_radius=cfg.YEAR_CELL_BORDER_RADIUS,
+                        alignment=ft.alignment.center,
+                        data=year,
+                        on_click=on_cell_click,
+                        on_hover=on_cell_hover
+                    )
+                    self._year_cells[year] = year_cell
+                    self._year_cell_bgcolors[year] = None
+                    year_cells.append(year_cell)
+
+                self._year_rows.append(
+                    ft.Row(
+                        year_cells,
+                        spacing=cfg.YEAR_ROW_SPACING,
+                        alignment=ft.MainAxisAlignment.CENTER
+                    )
                 )
-            )
 
-        return year_rows
+        # Restyle only the previously selected cell and the one for the display year
+        if self._selected_year != self.display_year:
+            plain_style = (theme_colors.text_primary, None)
+            selected_style = (theme_colors.selected_text_color, theme_colors.text_primary_bgcolor)
+            for year, (text_color, bg_color) in ((self._selected_year, plain_style),
+                                                 (self.display_year, selected_style)):
+                year_cell = self._year_cells.get(year)
+                if year_cell is None:
+                    continue
+                year_cell.bgcolor = bg_color
+                year_cell.content.color = text_color
+                self._year_cell_bgcolors[year] = bg_color
+            self._selected_year = self.display_year
+
+        return self._year_rows
 
     def create_input_mode_view(self, theme_colors):
         """Create the input mode view with text field"""
         input_field = ft.TextField(
-            color=theme_colors["input_color"],
+            color=theme_colors.input_color,
             value=self.format_date_for_input(self.selected_date),
             hint_text=self.config.INPUT_MODE_PLACEHOLDER,
             text_align=ft.TextAlign.CENTER,
             rtl=False,  # Date format is LTR
-            border_color=theme_colors["input_color"],
-            focused_border_color=theme_colors["input_focus_border_color"],
+            border_color=theme_colors.input_color,
+            focused_border_color=theme_colors.input_focus_border_color,
             text_size=self.config.INPUT_TEXT_FONT_SIZE,
             content_padding=ft.padding.all(12),
         )
 
         error_text = ft.Text(
             value=self.input_error,
-            color=theme_colors["error_text_color"],
+            color=theme_colors.error_text_color,
             size=self.config.ERROR_TEXT_FONT_SIZE,
             visible=bool(self.input_error),
             text_align=ft.TextAlign.CENTER
@@ -719,7 +1005,7 @@ class PersianDatePicker:
                 ft.Container(
                     content=ft.Text(
                         "تاریخ را وارد کنید:",
-                        color=theme_colors["text_primary"],
+                        color=theme_colors.text_primary,
                         size=self.config.HEADER_TEXT_FONT_SIZE,
                         text_align=ft.TextAlign.CENTER
                     ),
@@ -737,9 +1023,10 @@ class PersianDatePicker:
         return input_container, input_field, error_text
 
     def close_datepicker(self, page):
-        """Close the floating datepicker"""
-        if self.overlay_container and self.overlay_container in page.overlay:
+        """Close the floating datepicker (the widget tree is kept for the next show)"""
+        if self.overlay_container and self._attached and self.overlay_container in page.overlay:
             page.overlay.remove(self.overlay_container)
+            self._attached = False
 
             # Restore original keyboard handler if it was stored
             if self.keyboard_support and hasattr(self, '_original_keyboard_handler'):
@@ -748,6 +1035,80 @@ class PersianDatePicker:
             self.is_datepicker_open = False
             page.update()
 
+    def _on_ok_click(self, e):
+        """Handle OK button click"""
+        page = self._ui_page
+        # If in input mode, validate input first
+        if self.is_input_mode and self._input_field is not None:
+            input_value = self._input_field.value
+            date_obj, error = self.validate_date_input(input_value)
+
+            if date_obj:
+                self.selected_date = date_obj
+                self.input_error = ""
+            else:
+                # Show error and don't close
+                self.input_error = error
+                self._error_text.value = error
+                self._error_text.visible = True
+                page.update(self._error_text)
+                return
+
+        # Get complete date information
+        date_info = self.get_selected_date_info()
+        self.result = date_info
+
+        # Call callback if provided
+        if self.on_result_callback:
+            self.on_result_callback(date_info)
+
+        # Restore original keyboard handler (only if keyboard support is enabled)
+        if self.keyboard_support and hasattr(self,
+                                             '_original_keyboard_handler') and self._original_keyboard_handler is not None:
+            page.on_keyboard_event = self._original_keyboard_handler
+            self.is_datepicker_open = False
+
+        # Close the floating datepicker
+        self.close_datepicker(page)
+
+    def _on_cancel_click(self, e):
+        """Handle Cancel button click"""
+        page = self._ui_page
+        self.result = None
+
+        # Call callback if provided
+        if self.on_result_callback:
+            self.on_result_callback(None)
+
+        # Restore original keyboard handler (only if keyboard support is enabled)
+        if self.keyboard_support and hasattr(self,
+                                             '_original_keyboard_handler') and self._original_keyboard_handler is not None:
+            page.on_keyboard_event = self._original_keyboard_handler
+            self.is_datepicker_open = False
+
+        # Close the floating datepicker
+        self.close_datepicker(page)
+
+    def _on_overlay_click(self, e):
+        """Handle clicks on the overlay background (outside datepicker)"""
+        page = self._ui_page
+        # Close datepicker when clicking outside
+        self.result = None
+        if self.on_result_callback:
+            self.on_result_callback(None)
+
+        # Restore original keyboard handler (only if keyboard support is enabled)
+        if self.keyboard_support and hasattr(self,
+                                             '_original_keyboard_handler') and self._original_keyboard_handler is not None:
+            page.on_keyboard_event = self._original_keyboard_handler
+            self.is_datepicker_open = False
+
+        self.close_datepicker(page)
+
+    def hide(self, page: ft.Page):
+        """Hide the datepicker without reporting a result (same as close_datepicker)"""
+        self.close_datepicker(page)
+
     def show(self, page: ft.Page, is_theme_light: bool = True, display_year: Optional[int] = None,
              display_month: Optional[int] = None, reset_to_default: bool = True):
         """
@@ -836,14 +1197,56 @@ class PersianDatePicker:
 
 
     def create_datepicker(self, page, is_theme_light: bool = True):
-        """Create the complete datepicker UI as a floating overlay"""
+        """Show the datepicker as a floating overlay, building its UI only on first use"""
+        # The widget tree is tied to the page and theme it was built for
+        if self._ui_page is not page or self._ui_is_theme_light != is_theme_light:
+            self._build_ui(page, is_theme_light)
+
+        # Render the current state into the (possibly reused) widgets
+        self._refresh_ui()
+
+        if self.keyboard_support:
+            self._original_keyboard_handler = page.on_keyboard_event
+            page.on_keyboard_event = self._on_page_keyboard
+            self.is_datepicker_open = True
+        else:
+            # If keyboard support is disabled, don't override page handler
+            self._original_keyboard_handler = None
+            self.is_datepicker_open = False
 
-        theme_colors = self.config.get_theme_colors(is_theme_light)
+        # Mount the (possibly reused) widget tree; close_datepicker removes it again
+        if self.overlay_container not in page.overlay:
+            page.overlay.append(self.overlay_container)
+        self._attached = True
+        page.update()
+
+        return self.overlay_container
+
+    def _build_ui(self, page, is_theme_light):
+        """Build the datepicker widget tree and its event handlers for the given page and theme"""
+        # Unmount the previous tree if it is still shown
+        if self._ui_page is not None and self.overlay_container in self._ui_page.overlay:
+            self._ui_page.overlay.remove(self.overlay_container)
+
+        cfg = self.config
+        theme_colors = ThemeColors.from_mapping(cfg.get_theme_colors(is_theme_light))
 
         def on_date_click(day):
             """Handle date selection"""
+            previous_date = self.selected_date
             self.selected_date = jdatetime.date(self.display_year, self.display_month, day)
-            update_calendar_view()
+
+            # Same month in calendar mode: only the two affected cells and the date label change
+            restyled_cells = None
+            if not (self.is_year_mode or self.is_input_mode):
+                restyled_cells = self.restyle_selected_day(previous_date)
+            if restyled_cells is None:
+                update_calendar_view()
+                return
+
+            selected_date_text.value = self.format_selected_date()
+            self._last_render_state = render_state()
+            page.update(*restyled_cells, selected_date_text)
 
         def on_prev_month(e):
             """Navigate to previous month"""
@@ -852,7 +1255,7 @@ class PersianDatePicker:
                 self.display_year -= 1
             else:
                 self.display_month -= 1
-            update_calendar_view()
+            update_month_grid()
 
         def on_next_month(e):
             """Navigate to next month"""
@@ -861,7 +1264,7 @@ class PersianDatePicker:
                 self.display_year += 1
             else:
                 self.display_month += 1
-            update_calendar_view()
+            update_month_grid()
 
         def on_year_select_toggle(e):
             """Handle year selection button click"""
@@ -893,9 +1296,9 @@ class PersianDatePicker:
                 # Switching to input mode
                 self.temp_input_value = self.format_date_for_input(self.selected_date)
                 if mode_toggle_button:
-                    mode_toggle_button.icon = self.config.CALENDAR_MODE_ICON
-                    mode_toggle_button.tooltip = self.config.CALENDAR_MODE_BUTTON_TOOLTIP
-                datepicker.height = self.config.DATEPICKER_INPUT_MODE_HEIGHT
+                    mode_toggle_button.icon = cfg.CALENDAR_MODE_ICON
+                    mode_toggle_button.tooltip = cfg.CALENDAR_MODE_BUTTON_TOOLTIP
+                datepicker.height = cfg.DATEPICKER_INPUT_MODE_HEIGHT
             else:
                 # Switching FROM input mode - ALWAYS go to calendar mode (not year mode)
                 self.is_year_mode = False  # Force calendar mode
@@ -904,8 +1307,8 @@ class PersianDatePicker:
                 dropdown_icon.rotate = 0  # Reset year button icon
 
                 # Validate and apply input date if valid
-                if hasattr(update_calendar_view, 'input_field') and update_calendar_view.input_field:
-                    input_value = update_calendar_view.input_field.value
+                if self._input_field is not None:
+                    input_value = self._input_field.value
                     date_obj, error = self.validate_date_input(input_value)
 
                     if date_obj:
@@ -919,68 +1322,16 @@ class PersianDatePicker:
                         self.input_error = error
 
                 if mode_toggle_button:
-                    mode_toggle_button.icon = self.config.INPUT_MODE_ICON
-                    mode_toggle_button.tooltip = self.config.INPUT_MODE_BUTTON_TOOLTIP
-                datepicker.height = self.config.DATEPICKER_CALENDAR_MODE_HEIGHT
+                    mode_toggle_button.icon = cfg.INPUT_MODE_ICON
+                    mode_toggle_button.tooltip = cfg.INPUT_MODE_BUTTON_TOOLTIP
+                datepicker.height = cfg.DATEPICKER_CALENDAR_MODE_HEIGHT
 
                 # Clear error when switching to calendar mode (if no validation error)
-                if not hasattr(update_calendar_view, 'input_field') or not update_calendar_view.input_field:
+                if self._input_field is None:
                     self.input_error = ""
 
             update_calendar_view()
 
-        def on_ok_click(e):
-            """Handle OK button click"""
-            # If in input mode, validate input first
-            if self.is_input_mode and hasattr(update_calendar_view, 'input_field'):
-                input_value = update_calendar_view.input_field.value
-                date_obj, error = self.validate_date_input(input_value)
-
-                if date_obj:
-                    self.selected_date = date_obj
-                    self.input_error = ""
-                else:
-                    # Show error and don't close
-                    self.input_error = error
-                    update_calendar_view.error_text.value = error
-                    update_calendar_view.error_text.visible = True
-                    page.update()
-                    return
-
-            # Get complete date information
-            date_info = self.get_selected_date_info()
-            self.result = date_info
-
-            # Call callback if provided
-            if self.on_result_callback:
-                self.on_result_callback(date_info)
-
-            # Restore original keyboard handler (only if keyboard support is enabled)
-            if self.keyboard_support and hasattr(self,
-                                                 '_original_keyboard_handler') and self._original_keyboard_handler is not None:
-                page.on_keyboard_event = self._original_keyboard_handler
-                self.is_datepicker_open = False
-
-            # Close the floating datepicker
-            self.close_datepicker(page)
-
-        def on_cancel_click(e):
-            """Handle Cancel button click"""
-            self.result = None
-
-            # Call callback if provided
-            if self.on_result_callback:
-                self.on_result_callback(None)
-
-            # Restore original keyboard handler (only if keyboard support is enabled)
-            if self.keyboard_support and hasattr(self,
-                                                 '_original_keyboard_handler') and self._original_keyboard_handler is not None:
-                page.on_keyboard_event = self._original_keyboard_handler
-                self.is_datepicker_open = False
-
-            # Close the floating datepicker
-            self.close_datepicker(page)
-
         def on_today_click(e):
             """Handle today button click - navigate to current date"""
             today = jdatetime.date.today()
@@ -992,21 +1343,6 @@ class PersianDatePicker:
             self.input_error = ""  # Clear any errors
             update_calendar_view()
 
-        def on_overlay_click(e):
-            """Handle clicks on the overlay background (outside datepicker)"""
-            # Close datepicker when clicking outside
-            self.result = None
-            if self.on_result_callback:
-                self.on_result_callback(None)
-
-            # Restore original keyboard handler (only if keyboard support is enabled)
-            if self.keyboard_support and hasattr(self,
-                                                 '_original_keyboard_handler') and self._original_keyboard_handler is not None:
-                page.on_keyboard_event = self._original_keyboard_handler
-                self.is_datepicker_open = False
-
-            self.close_datepicker(page)
-
         # Keyboard event handling (only if keyboard support is enabled)
         if self.keyboard_support:
             def on_page_keyboard(e: ft.KeyboardEvent):
@@ -1019,9 +1355,9 @@ class PersianDatePicker:
                     return
 
                 if e.key == "Escape":
-                    on_cancel_click(e)
+                    self._on_cancel_click(e)
                 elif e.key == "Enter":
-                    on_ok_click(e)
+                    self._on_ok_click(e)
                 elif not self.is_year_mode and not self.is_input_mode:  # Only in calendar mode
                     if e.key == "D":
                         # Move to previous day with month boundary crossing
@@ -1052,25 +1388,26 @@ class PersianDatePicker:
         # Selected date panel (right side for RTL)
         selected_date_text = ft.Text(
             self.format_selected_date(),
-            color=theme_colors['text_secondary'],
-            size=self.config.SELECTED_DATE_FONT_SIZE_CALENDAR_MODE,
-            weight=self.config.SELECTED_DATE_FONT_WEIGHT,
+            color=theme_colors.text_secondary,
+            size=cfg.SELECTED_DATE_FONT_SIZE_CALENDAR_MODE,
+            weight=cfg.SELECTED_DATE_FONT_WEIGHT,
             text_align=ft.TextAlign.RIGHT
         )
 
         buttons_row = None
         mode_toggle_button = None  # Initialize before creating the row
+        today_button_style, ok_button_style, cancel_button_style = self.get_button_styles(theme_colors)
 
         if self.enable_input_mode:
             # Create the mode toggle button separately for easier reference
             mode_toggle_button = ft.IconButton(
-                icon=self.config.INPUT_MODE_ICON,
-                icon_size=self.config.EDIT_ICON_SIZE,
-                icon_color=theme_colors['text_header'],
-                tooltip=self.config.INPUT_MODE_BUTTON_TOOLTIP,
+                icon=cfg.INPUT_MODE_ICON,
+                icon_size=cfg.EDIT_ICON_SIZE,
+                icon_color=theme_colors.text_header,
+                tooltip=cfg.INPUT_MODE_BUTTON_TOOLTIP,
                 on_click=on_mode_toggle,
                 style=ft.ButtonStyle(
-                    shape=ft.RoundedRectangleBorder(radius=self.config.NAV_BUTTON_BORDER_RADIUS)
+                    shape=ft.RoundedRectangleBorder(radius=cfg.NAV_BUTTON_BORDER_RADIUS)
                 )
             )
 
@@ -1078,15 +1415,10 @@ class PersianDatePicker:
                 [
                     mode_toggle_button,  # Use the variable we created
                     ft.ElevatedButton(
-                        text=self.config.TODAY_BUTTON_TEXT,
-                        style=ft.ButtonStyle(
-                            bgcolor=theme_colors['secondary_color'],
-                            color=theme_colors['selected_text_color'],
-                            padding=ft.padding.symmetric(horizontal=12, vertical=6),
-                            shape=ft.RoundedRectangleBorder(radius=8)
-                        ),
+                        text=cfg.TODAY_BUTTON_TEXT,
+                        style=today_button_style,
                         on_click=on_today_click,
-                        tooltip=self.config.TODAY_BUTTON_TOOLTIP
+                        tooltip=cfg.TODAY_BUTTON_TOOLTIP
                     )
                 ],
                 alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
@@ -1097,33 +1429,35 @@ class PersianDatePicker:
             buttons_row = ft.Row(
                 [
                     ft.ElevatedButton(
-                        text=self.config.TODAY_BUTTON_TEXT,
-                        style=ft.ButtonStyle(
-                            bgcolor=theme_colors['secondary_color'],
-                            color=theme_colors['selected_text_color'],
-                            padding=ft.padding.symmetric(horizontal=12, vertical=6),
-                            shape=ft.RoundedRectangleBorder(radius=8)
-                        ),
+                        text=cfg.TODAY_BUTTON_TEXT,
+                        style=today_button_style,
                         on_click=on_today_click,
-                        tooltip=self.config.TODAY_BUTTON_TOOLTIP
+                        tooltip=cfg.TODAY_BUTTON_TOOLTIP
                     )
                 ],
                 alignment=ft.MainAxisAlignment.END
             )
 
+        # Per-mode margins, swapped by reference in update_calendar_view
+        edit_icon_margin_calendar_mode = ft.margin.only(top=cfg.EDIT_ICON_TOP_MARGIN_CALENDAR_MODE)
+        edit_icon_margin_input_mode = ft.margin.only(top=cfg.EDIT_ICON_TOP_MARGIN_INPUT_MODE)
+        action_buttons_margin_calendar_mode = ft.margin.only(top=cfg.ACTION_BUTTONS_MARGIN_TOP_CALENDAR_MODE)
+        action_buttons_margin_year_mode = ft.margin.only(top=cfg.ACTION_BUTTONS_MARGIN_TOP_YEAR_MODE)
+        action_buttons_margin_input_mode = ft.margin.only(top=cfg.ACTION_BUTTONS_MARGIN_TOP_INPUT_MODE)
+
         action_buttons_row_control = ft.Container(
             content=buttons_row,
-            margin=ft.margin.only(top=self.config.EDIT_ICON_TOP_MARGIN_CALENDAR_MODE),
+            margin=edit_icon_margin_calendar_mode,
             alignment=ft.alignment.center_right
         )
 
         right_panel_controls = [
             ft.Container(
                 content=ft.Text(
-                    self.config.HEADER_TEXT,
-                    color=theme_colors['text_header'],
-                    size=self.config.HEADER_TEXT_FONT_SIZE,
-                    weight=self.config.HEADER_FONT_WEIGHT,
+                    cfg.HEADER_TEXT,
+                    color=theme_colors.text_header,
+                    size=cfg.HEADER_TEXT_FONT_SIZE,
+                    weight=cfg.HEADER_FONT_WEIGHT,
                     text_align=ft.TextAlign.RIGHT
                 ),
                 alignment=ft.alignment.center_right
@@ -1136,26 +1470,27 @@ class PersianDatePicker:
             content=ft.Column(
                 right_panel_controls,
                 alignment=ft.MainAxisAlignment.START,
-                spacing=self.config.SELECTED_DATE_COLUMN_SPACING,
+                spacing=cfg.SELECTED_DATE_COLUMN_SPACING,
                 horizontal_alignment=ft.CrossAxisAlignment.END
             ),
-            bgcolor=theme_colors['right_panel_bgcolor'],
-            padding=self.config.RIGHT_PANEL_PADDING,
-            width=self.config.RIGHT_PANEL_WIDTH
+            bgcolor=theme_colors.right_panel_bgcolor,
+            padding=cfg.RIGHT_PANEL_PADDING,
+            width=cfg.RIGHT_PANEL_WIDTH
         )
 
+        self._month_year_shown = (self.display_year, self.display_month)
         self.month_year_text = ft.Text(
-            f"{self.persian_months[self.display_month - 1]} {self.to_persian_num(self.display_year)}",
-            color=theme_colors['text_primary'],
-            size=self.config.MONTH_YEAR_FONT_SIZE,
-            weight=self.config.MONTH_YEAR_FONT_WEIGHT,
+            self.get_month_year_label(*self._month_year_shown),
+            color=theme_colors.text_primary,
+            size=cfg.MONTH_YEAR_FONT_SIZE,
+            weight=cfg.MONTH_YEAR_FONT_WEIGHT,
             text_align=ft.TextAlign.RIGHT
         )
 
         dropdown_icon = ft.Icon(
-            name=self.config.DROPDOWN_ICON,
-            color=theme_colors['text_muted'],
-            size=self.config.DROPDOWN_ICON_SIZE,
+            name=cfg.DROPDOWN_ICON,
+            color=theme_colors.text_muted,
+            size=cfg.DROPDOWN_ICON_SIZE,
             rotate=0,  # Initial rotation
             animate_rotation=ft.Animation(duration=250, curve=ft.AnimationCurve.EASE_OUT_SINE)
         )
@@ -1172,12 +1507,12 @@ class PersianDatePicker:
             ),
             style=ft.ButtonStyle(
                 padding=ft.padding.symmetric(
-                    horizontal=self.config.YEAR_SELECT_BUTTON_PADDING_H,
-                    vertical=self.config.YEAR_SELECT_BUTTON_PADDING_V
+                    horizontal=cfg.YEAR_SELECT_BUTTON_PADDING_H,
+                    vertical=cfg.YEAR_SELECT_BUTTON_PADDING_V
                 ),
                 bgcolor=ft.Colors.TRANSPARENT,
-                overlay_color=ft.Colors.with_opacity(self.config.BUTTON_HOVER_OPACITY, self.config.TEXT_MUTED),
-                shape=ft.RoundedRectangleBorder(radius=self.config.YEAR_SELECT_BUTTON_BORDER_RADIUS)
+                overlay_color=ft.Colors.with_opacity(cfg.BUTTON_HOVER_OPACITY, cfg.TEXT_MUTED),
+                shape=ft.RoundedRectangleBorder(radius=cfg.YEAR_SELECT_BUTTON_BORDER_RADIUS)
             ),
             on_click=on_year_select_toggle
         )
@@ -1186,23 +1521,23 @@ class PersianDatePicker:
         nav_buttons = ft.Row(
             [
                 ft.IconButton(
-                    icon=self.config.PREV_MONTH_ICON,
-                    icon_color=theme_colors['text_muted'],
-                    icon_size=self.config.NAV_ICON_SIZE,
+                    icon=cfg.PREV_MONTH_ICON,
+                    icon_color=theme_colors.text_muted,
+                    icon_size=cfg.NAV_ICON_SIZE,
                     on_click=on_prev_month,
-                    tooltip=self.config.PREV_MONTH_TOOLTIP,
+                    tooltip=cfg.PREV_MONTH_TOOLTIP,
                     style=ft.ButtonStyle(
-                        shape=ft.RoundedRectangleBorder(radius=self.config.NAV_BUTTON_BORDER_RADIUS)
+                        shape=ft.RoundedRectangleBorder(radius=cfg.NAV_BUTTON_BORDER_RADIUS)
                     )
                 ),
                 ft.IconButton(
-                    icon=self.config.NEXT_MONTH_ICON,
-                    icon_color=theme_colors['text_muted'],
-                    icon_size=self.config.NAV_ICON_SIZE,
+                    icon=cfg.NEXT_MONTH_ICON,
+                    icon_color=theme_colors.text_muted,
+                    icon_size=cfg.NAV_ICON_SIZE,
                     on_click=on_next_month,
-                    tooltip=self.config.NEXT_MONTH_TOOLTIP,
+                    tooltip=cfg.NEXT_MONTH_TOOLTIP,
                     style=ft.ButtonStyle(
-                        shape=ft.RoundedRectangleBorder(radius=self.config.NAV_BUTTON_BORDER_RADIUS)
+                        shape=ft.RoundedRectangleBorder(radius=cfg.NAV_BUTTON_BORDER_RADIUS)
                     )
                 )
             ],
@@ -1221,29 +1556,17 @@ class PersianDatePicker:
             alignment=ft.MainAxisAlignment.SPACE_BETWEEN
         )
 
-        # Day headers
-        day_headers = ft.Row(
-            [
-                ft.Container(
-                    content=ft.Text(
-                        day,
-                        color=theme_colors['text_header'],
-                        size=self.config.DAY_HEADER_FONT_SIZE,
-                        weight=self.config.DAY_HEADER_FONT_WEIGHT
-                    ),
-                    width=self.config.DAY_CELL_WIDTH,
-                    height=self.config.DAY_CELL_HEIGHT,
-                    alignment=ft.alignment.center
-                )
-                for day in self.persian_day_abbr
-            ],
-            spacing=self.config.CALENDAR_ROW_SPACING
-        )
+        # Day headers (kept per theme; widgets cannot move to another page)
+        if self._ui_page is not page:
+            self._day_headers_cache = {}
+        day_headers = self._day_headers_cache.get(is_theme_light)
+        if day_headers is None:
+            day_headers = self._day_headers_cache[is_theme_light] = self.create_day_headers(theme_colors)
 
-        # Calendar grid (will be updated dynamically)
+        # Holds the month, year and input views; update_calendar_view shows one of them
         calendar_container = ft.Column(
-            spacing=self.config.CALENDAR_COLUMN_SPACING,
-            height=self.config.CALENDAR_CONTAINER_HEIGHT,
+            spacing=cfg.CALENDAR_COLUMN_SPACING,
+            height=cfg.CALENDAR_CONTAINER_HEIGHT,
             scroll=ft.ScrollMode.AUTO,
             auto_scroll=True
         )
@@ -1254,45 +1577,32 @@ class PersianDatePicker:
                 ft.Row(
                     [
                         ft.ElevatedButton(
-                            self.config.OK_BUTTON_TEXT,
-                            style=ft.ButtonStyle(
-                                bgcolor=theme_colors['secondary_color'],
-                                color=theme_colors['selected_text_color'],
-                                padding=ft.padding.symmetric(
-                                    horizontal=self.config.OK_BUTTON_PADDING_H,
-                                    vertical=self.config.OK_BUTTON_PADDING_V
-                                )
-                            ),
-                            on_click=on_ok_click
+                            cfg.OK_BUTTON_TEXT,
+                            style=ok_button_style,
+                            on_click=self._on_ok_click
                         ),
                         ft.TextButton(
-                            self.config.CANCEL_BUTTON_TEXT,
-                            style=ft.ButtonStyle(
-                                color=theme_colors['secondary_color'],
-                                padding=ft.padding.symmetric(
-                                    horizontal=self.config.CANCEL_BUTTON_PADDING_H,
-                                    vertical=self.config.CANCEL_BUTTON_PADDING_V
-                                )
-                            ),
-                            on_click=on_cancel_click
+                            cfg.CANCEL_BUTTON_TEXT,
+                            style=cancel_button_style,
+                            on_click=self._on_cancel_click
                         )
                     ],
                     alignment=ft.MainAxisAlignment.START,
-                    spacing=self.config.BUTTON_ROW_SPACING
+                    spacing=cfg.BUTTON_ROW_SPACING
                 ),
-                margin=ft.margin.only(top=self.config.ACTION_BUTTONS_MARGIN_TOP_CALENDAR_MODE)
+                margin=action_buttons_margin_calendar_mode
             )
         )
 
         top_calendar_container_dividers = ft.Divider(
             visible=False,
-            height=self.config.DIVIDER_HEIGHT,
-            color=theme_colors['divider_color']
+            height=cfg.DIVIDER_HEIGHT,
+            color=theme_colors.divider_color
         )
         bottom_calendar_container_dividers = ft.Divider(
             visible=False,
-            height=self.config.DIVIDER_HEIGHT,
-            color=theme_colors['divider_color']
+            height=cfg.DIVIDER_HEIGHT,
+            color=theme_colors.divider_color
         )
 
         # Left panel with calendar
@@ -1306,9 +1616,9 @@ class PersianDatePicker:
                     bottom_calendar_container_dividers,
                     action_buttons
                 ],
-                spacing=self.config.MAIN_COLUMN_SPACING
+                spacing=cfg.MAIN_COLUMN_SPACING
             ),
-            padding=ft.padding.all(self.config.LEFT_PANEL_PADDING),
+            padding=ft.padding.all(cfg.LEFT_PANEL_PADDING),
             expand=True
         )
 
@@ -1317,66 +1627,95 @@ class PersianDatePicker:
             content=ft.Row(
                 [
                     right_panel,
-                    ft.VerticalDivider(width=self.config.VERTICAL_DIVIDER_WIDTH, color=theme_colors['divider_color']),
+                    ft.VerticalDivider(width=cfg.VERTICAL_DIVIDER_WIDTH, color=theme_colors.divider_color),
                     left_panel
                 ],
                 rtl=True,
                 spacing=0
             ),
-            bgcolor=theme_colors['main_bgcolor'],
-            border_radius=self.config.BORDER_RADIUS,
+            bgcolor=theme_colors.main_bgcolor,
+            border_radius=cfg.BORDER_RADIUS,
             shadow=ft.BoxShadow(
-                spread_radius=self.config.SHADOW_SPREAD_RADIUS,
-                blur_radius=self.config.SHADOW_BLUR_RADIUS,
-                color=self.config.SHADOW_COLOR,
-                offset=ft.Offset(self.config.SHADOW_OFFSET_X, self.config.SHADOW_OFFSET_Y)
+                spread_radius=cfg.SHADOW_SPREAD_RADIUS,
+                blur_radius=cfg.SHADOW_BLUR_RADIUS,
+                color=cfg.SHADOW_COLOR,
+                offset=ft.Offset(cfg.SHADOW_OFFSET_X, cfg.SHADOW_OFFSET_Y)
             ),
-            width=self.config.DATEPICKER_WIDTH + self.config.RIGHT_PANEL_WIDTH,
-            height=self.config.DATEPICKER_CALENDAR_MODE_HEIGHT,
+            width=cfg.DATEPICKER_WIDTH + cfg.RIGHT_PANEL_WIDTH,
+            height=cfg.DATEPICKER_CALENDAR_MODE_HEIGHT,
             animate=ft.Animation(300, ft.AnimationCurve.EASE_OUT)
         )
 
+        # Calendar grid cells are created once and refreshed in place by update_calendar_view
+        calendar_rows = self.create_calendar_grid(on_date_click, theme_colors, page)
+        self._year_rows = None  # Year grid is built on first entry to year mode
+        self._input_field = None  # Input mode TextField and error text, set on each input render
+        self._error_text = None
+        self._last_render_state = None
+
+        month_view = ft.Column(calendar_rows, spacing=cfg.CALENDAR_COLUMN_SPACING)
+        year_view = ft.Column(spacing=cfg.CALENDAR_COLUMN_SPACING, visible=False)
+        input_view = ft.Column(visible=False)
+        calendar_container.controls = [month_view, year_view, input_view]
+
+        def show_view(view):
+            """Make view the only visible child of calendar_container"""
+            month_view.visible = view is month_view
+            year_view.visible = view is year_view
+            input_view.visible = view is input_view
+
+        def render_state():
+            """Everything update_calendar_view renders from, to skip redraws that change nothing"""
+            return (self.is_input_mode, self.is_year_mode, self.display_year, self.display_month,
+                    self.selected_date, self.input_error)
+
         # In the update_calendar_view function, find this section and update it:
         def update_calendar_view():
             """Update the calendar view based on current mode"""
+            # Nothing changed since the last render (e.g. Today pressed while already on today)
+            state = render_state()
+            if state == self._last_render_state:
+                return
+            self._last_render_state = state
+
             if self.is_input_mode:
                 # Show input field instead of calendar
                 nav_buttons.visible = False
                 day_headers.visible = False
                 calendar_header.visible = False
-                selected_date_text.size = self.config.SELECTED_DATE_FONT_SIZE_INPUT_MODE
-                action_buttons_row_control.margin.top = self.config.EDIT_ICON_TOP_MARGIN_INPUT_MODE
-                calendar_container.height = self.config.CALENDAR_CONTAINER_HEIGHT_INPUT_MODE
+                selected_date_text.size = cfg.SELECTED_DATE_FONT_SIZE_INPUT_MODE
+                action_buttons_row_control.margin = edit_icon_margin_input_mode
+                calendar_container.height = cfg.CALENDAR_CONTAINER_HEIGHT_INPUT_MODE
 
                 top_calendar_container_dividers.visible = False
                 bottom_calendar_container_dividers.visible = False
 
                 # Create input field - STORE THE TEXTFIELD DIRECTLY, NOT THE CONTAINER
                 input_field = ft.TextField(
-                    color=theme_colors["input_color"],
-                    label=self.config.INPUT_MODE_LABEL,
+                    color=theme_colors.input_color,
+                    label=cfg.INPUT_MODE_LABEL,
                     label_style=ft.TextStyle(
-                        color=theme_colors["input_color"],
+                        color=theme_colors.input_color,
                     ),
                     value=self.format_date_for_input(self.selected_date),
-                    hint_text=self.config.INPUT_MODE_PLACEHOLDER,
+                    hint_text=cfg.INPUT_MODE_PLACEHOLDER,
                     text_align=ft.TextAlign.RIGHT,
                     rtl=False,  # Date format is LTR
-                    border_color=theme_colors.get("input_color", theme_colors["text_muted"]),
-                    focused_border_color=theme_colors.get("input_focus_border_color", theme_colors["secondary_color"]),
+                    border_color=theme_colors.input_color,
+                    focused_border_color=theme_colors.input_focus_border_color,
                     text_size=getattr(self.config, 'INPUT_TEXT_FONT_SIZE', 16),
                     content_padding=ft.padding.all(12),
                 )
 
                 input_container = ft.Container(
                     content=input_field,
-                    margin=ft.margin.only(top=self.config.TEXT_FIELD_MARGIN_TOP)
+                    margin=ft.margin.only(top=cfg.TEXT_FIELD_MARGIN_TOP)
                 )
 
                 error_text = ft.Text(
                     value=self.input_error,
-                    color=theme_colors["error_text_color"] if "error_text_color" in theme_colors else ft.Colors.RED,
-                    size=self.config.ERROR_TEXT_FONT_SIZE if hasattr(self.config, 'ERROR_TEXT_FONT_SIZE') else 12,
+                    color=theme_colors.error_text_color,
+                    size=cfg.ERROR_TEXT_FONT_SIZE if hasattr(self.config, 'ERROR_TEXT_FONT_SIZE') else 12,
                     visible=bool(self.input_error),
                     text_align=ft.TextAlign.CENTER
                 )
@@ -1391,90 +1730,117 @@ class PersianDatePicker:
                     horizontal_alignment=ft.CrossAxisAlignment.CENTER
                 )
 
-                calendar_container.controls = [main_input_container]
+                input_view.controls = [main_input_container]
+                show_view(input_view)
 
                 # Store references for OK button validation - NOW STORING THE TEXTFIELD OBJECT
-                update_calendar_view.input_field = input_field  # This is now the TextField, not Container
-                update_calendar_view.error_text = error_text
+                self._input_field = input_field  # This is now the TextField, not Container
+                self._error_text = error_text
 
                 # Ensure input mode height
-                datepicker.height = self.config.DATEPICKER_INPUT_MODE_HEIGHT
-                action_buttons.margin.top = self.config.ACTION_BUTTONS_MARGIN_TOP_INPUT_MODE
+                datepicker.height = cfg.DATEPICKER_INPUT_MODE_HEIGHT
+                action_buttons.margin = action_buttons_margin_input_mode
 
             elif self.is_year_mode:
                 # Hide navigation buttons and day headers, show year grid
                 nav_buttons.visible = False
                 day_headers.visible = False
                 calendar_header.visible = True
-                selected_date_text.size = self.config.SELECTED_DATE_FONT_SIZE_CALENDAR_MODE
-                action_buttons_row_control.margin.top = self.config.EDIT_ICON_TOP_MARGIN_CALENDAR_MODE
-                calendar_container.height = self.config.CALENDAR_CONTAINER_HEIGHT_INPUT_MODE
+                selected_date_text.size = cfg.SELECTED_DATE_FONT_SIZE_CALENDAR_MODE
+                action_buttons_row_control.margin = edit_icon_margin_calendar_mode
+                calendar_container.height = cfg.CALENDAR_CONTAINER_HEIGHT_INPUT_MODE
 
                 top_calendar_container_dividers.visible = True
                 bottom_calendar_container_dividers.visible = True
                 year_rows = self.create_year_grid(on_year_click, theme_colors, page)
-                calendar_container.controls = year_rows
-                action_buttons.margin.top = self.config.ACTION_BUTTONS_MARGIN_TOP_YEAR_MODE
+                if not year_view.controls:
+                    year_view.controls = year_rows
+                show_view(year_view)
+                # Only the year grid can outgrow the container
+                calendar_container.scroll = ft.ScrollMode.AUTO
+                calendar_container.auto_scroll = True
+                action_buttons.margin = action_buttons_margin_year_mode
                 # Ensure full height for year mode
-                datepicker.height = self.config.DATEPICKER_CALENDAR_MODE_HEIGHT
-                calendar_container.height = self.config.CALENDAR_CONTAINER_HEIGHT_CALENDAR_MODE
+                datepicker.height = cfg.DATEPICKER_CALENDAR_MODE_HEIGHT
+                calendar_container.height = cfg.CALENDAR_CONTAINER_HEIGHT_CALENDAR_MODE
 
             else:
                 # Show navigation buttons and day headers, show calendar grid
                 nav_buttons.visible = True
                 day_headers.visible = True
                 calendar_header.visible = True
-                selected_date_text.size = self.config.SELECTED_DATE_FONT_SIZE_CALENDAR_MODE
-                action_buttons_row_control.margin.top = self.config.EDIT_ICON_TOP_MARGIN_CALENDAR_MODE
-                calendar_container.height = self.config.CALENDAR_CONTAINER_HEIGHT_CALENDAR_MODE
+                selected_date_text.size = cfg.SELECTED_DATE_FONT_SIZE_CALENDAR_MODE
+                action_buttons_row_control.margin = edit_icon_margin_calendar_mode
+                calendar_container.height = cfg.CALENDAR_CONTAINER_HEIGHT_CALENDAR_MODE
 
                 top_calendar_container_dividers.visible = False
                 bottom_calendar_container_dividers.visible = False
-                calendar_rows = self.create_calendar_grid(on_date_click, theme_colors, page)
-                calendar_container.controls = calendar_rows
+                self.update_calendar_grid()
+                show_view(month_view)
+                # The month grid always fits, so skip the scroll machinery
+                calendar_container.scroll = None
+                calendar_container.auto_scroll = False
                 selected_date_text.value = self.format_selected_date()
-                action_buttons.margin.top = self.config.ACTION_BUTTONS_MARGIN_TOP_CALENDAR_MODE
+                action_buttons.margin = action_buttons_margin_calendar_mode
                 # Ensure full height for calendar mode
-                datepicker.height = self.config.DATEPICKER_CALENDAR_MODE_HEIGHT
+                datepicker.height = cfg.DATEPICKER_CALENDAR_MODE_HEIGHT
 
-            self.month_year_text.value = f"{self.persian_months[self.display_month - 1]} {self.to_persian_num(self.display_year)}"
-            page.update()
+            refresh_month_year_text()
+
+            # Everything above lives inside the datepicker, so only its subtree needs sending.
+            # Before the overlay is attached, create_datepicker sends the first update itself
+            if self._attached:
+                datepicker.update()
+
+        def refresh_month_year_text():
+            """Update the month/year label; it only changes with the display month"""
+            if self._month_year_shown != (self.display_year, self.display_month):
+                self._month_year_shown = (self.display_year, self.display_month)
+                self.month_year_text.value = self.get_month_year_label(*self._month_year_shown)
+
+        def update_month_grid():
+            """Refresh only the calendar grid and month/year label after navigating months"""
+            if self.is_year_mode or self.is_input_mode or not month_view.visible:
+                update_calendar_view()
+                return
 
-        # Initial calendar update
-        update_calendar_view()
+            self.update_calendar_grid()
+            refresh_month_year_text()
+            self._last_render_state = render_state()
+            if self._attached:
+                page.update(month_view, self.month_year_text)
+
+        def refresh_ui():
+            """Reset widgets changed during the previous session, then render the current state"""
+            self._last_render_state = None  # Hover styling may have outlived the last session
+            dropdown_icon.rotate = 0
+            if mode_toggle_button:
+                mode_toggle_button.icon = cfg.INPUT_MODE_ICON
+                mode_toggle_button.tooltip = cfg.INPUT_MODE_BUTTON_TOOLTIP
+            update_calendar_view()
 
         # Create the overlay container (semi-transparent background)
+        # The background and the datepicker are siblings, so taps on the datepicker never reach
+        # the background's close handler and the datepicker needs no click handler of its own
         self.overlay_container = ft.Container(
             content=ft.Stack(
                 [
-                    # Semi-transparent background
+                    # Semi-transparent background filling the stack
                     ft.Container(
-                        bgcolor=ft.Colors.with_opacity(self.config.OVERLAY_BGCOLOR_OPACITY, ft.Colors.BLACK),
-                        expand=True,
-                        on_click=on_overlay_click  # Close when clicking outside
+                        bgcolor=ft.Colors.with_opacity(cfg.OVERLAY_BGCOLOR_OPACITY, ft.Colors.BLACK),
+                        on_click=self._on_overlay_click,  # Close when clicking outside
+                        left=0, top=0, right=0, bottom=0
                     ),
-                    # Centered datepicker
-                    ft.Container(
-                        content=datepicker,
-                        alignment=ft.alignment.center,
-                        expand=True
-                    )
-                ]
+                    datepicker  # Centered by the stack's alignment
+                ],
+                alignment=ft.alignment.center,
+                expand=True
             ),
             expand=True
         )
 
-        if self.keyboard_support:
-            self._original_keyboard_handler = page.on_keyboard_event
-            page.on_keyboard_event = on_page_keyboard
-            self.is_datepicker_open = True
-        else:
-            # If keyboard support is disabled, don't override page handler
-            self._original_keyboard_handler = None
-            self.is_datepicker_open = False
-
-        # Add to page overlay
-        page.overlay.append(self.overlay_container)
-        page.update()
-
-        return self.overlay_container
+        self._refresh_ui = refresh_ui
+        self._on_page_keyboard = on_page_keyboard if self.keyboard_support else None
+        self._ui_page = page
+        self._ui_is_theme_light = is_theme_light
+        self._attached = False
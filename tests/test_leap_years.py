@@ -0,0 +1,26 @@
+import unittest
+
+import jdatetime
+
+from persian_datepicker.persian_datepicker import PersianDatePicker, _is_jleap
+
+# Fixed range, independent of today's date
+YEARS = range(1200, 1601)
+
+
+class LeapYearTests(unittest.TestCase):
+    def test_is_jleap_matches_jdatetime(self):
+        for year in YEARS:
+            with self.subTest(year=year):
+                self.assertEqual(_is_jleap(year), jdatetime.date(year, 1, 1).isleap())
+
+    def test_esfand_length_follows_leap_years(self):
+        picker = PersianDatePicker()
+        for year in YEARS:
+            with self.subTest(year=year):
+                expected = 30 if jdatetime.date(year, 1, 1).isleap() else 29
+                self.assertEqual(picker.get_month_days(year, 12), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()